@@ -1,4 +1,4 @@
-from flask import Flask, render_template
+from flask import Flask, render_template, request, jsonify
 from collections import Counter
 from fakeNewsClassifier.pipeline.prediction_pipeline import PredictionPipeline
 from fakeNewsClassifier.components.web_scraper import WebScraper
@@ -27,10 +27,17 @@ def home():
         classified_articles = []
         all_categories = []
 
-        for item in headlines_data:
-            headline = item['headline']
-            predicted_category = prediction_pipeline.predict(headline)
-            classified_articles.append({'headline': headline, 'category': predicted_category})
+        headlines = [item['headline'] for item in headlines_data]
+        explanations = prediction_pipeline.predict_explain(headlines, k=3)
+
+        for headline, explanation in zip(headlines, explanations):
+            predicted_category = explanation['category']
+            classified_articles.append({
+                'headline': headline,
+                'category': predicted_category,
+                'confidence': explanation['probabilities'][0]['probability'],
+                'terms': [item['term'] for item in explanation['terms']]
+            })
             all_categories.append(predicted_category)
         
         # 3. Summarize the topics
@@ -44,5 +51,30 @@ def home():
         logger.error(f"An error occurred on the home page: {e}")
         return render_template('index.html', error=f"An unexpected error occurred: {e}")
 
+@app.route('/api/explain', methods=['POST'])
+def explain():
+    """
+    Classifies the posted texts and returns their top categories and terms.
+
+    Expects a JSON body such as {"texts": ["headline", ...], "k": 3}.
+    """
+    try:
+        payload = request.get_json(silent=True) or {}
+        texts = payload.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            return jsonify({'error': "'texts' must be a list of strings."}), 400
+        k = payload.get('k', 3)
+        # bool is a subclass of int, so reject true/false explicitly
+        if isinstance(k, bool) or not isinstance(k, int) or k < 1:
+            return jsonify({'error': "'k' must be a positive integer."}), 400
+
+        logger.info(f"Explain request received for {len(texts)} texts.")
+        prediction_pipeline = PredictionPipeline()
+        return jsonify({'predictions': prediction_pipeline.predict_explain(texts, k=k)})
+
+    except Exception as e:
+        logger.error(f"An error occurred on the explain endpoint: {e}")
+        return jsonify({'error': f"An unexpected error occurred: {e}"}), 500
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8080)
\ No newline at end of file
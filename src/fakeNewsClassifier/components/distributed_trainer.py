@@ -0,0 +1,330 @@
+import os
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+from logging.handlers import QueueListener
+from multiprocessing.connection import Listener, Client
+import numpy as np
+import pandas as pd
+import joblib
+from pathlib import Path
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score
+from fakeNewsClassifier.logging import logger, forward_to_queue
+from fakeNewsClassifier.entity.config_entity import DistributedTrainerConfig
+from fakeNewsClassifier.utils.common import save_json
+
+
+def run_worker(address: tuple, authkey: bytes, log_queue=None):
+    """
+    Runs one data-parallel training worker.
+
+    The worker connects to the coordinator, loads and vectorizes its training
+    shard, and then for every round starts from the averaged parameters it
+    receives, makes `local_epochs` passes over its shard and sends its updated
+    parameters back, until it receives a 'stop' message.
+
+    This function only needs the coordinator's address and the shard path to
+    be reachable, so it can equally be started on another machine.
+
+    Args:
+        address (tuple): (host, port) the coordinator listens on.
+        authkey (bytes): Shared secret used to authenticate the connection.
+        log_queue (optional): Queue the worker's log records are sent to, so the
+                              coordinator writes them. Defaults to None, which keeps
+                              the worker's own logging configuration.
+    """
+    if log_queue is not None:
+        forward_to_queue(log_queue)
+    with Client(address, authkey=authkey) as conn:
+        setup = conn.recv()
+        shard_df = pd.read_csv(setup['shard_path'])
+        shard_df.dropna(subset=['text', 'label'], inplace=True)
+        features = setup['vectorizer'].transform(shard_df['text'])
+        labels = shard_df['label'].to_numpy()
+        model = SGDClassifier(loss='log_loss', alpha=setup['alpha'], random_state=42)
+        logger.info(f"Worker loaded shard {setup['shard_path']} with {len(labels)} samples.")
+        conn.send(len(labels))
+
+        while True:
+            command, params = conn.recv()
+            if command == 'stop':
+                break
+            # The first round has no average yet and starts from zero-initialized parameters
+            if params is not None:
+                model.coef_, model.intercept_ = params[0].copy(), params[1].copy()
+            for _ in range(setup['local_epochs']):
+                model.partial_fit(features, labels, classes=setup['classes'])
+            conn.send((model.coef_, model.intercept_))
+
+
+class DistributedTrainer:
+    """
+    Trains a linear text classifier with data-parallel workers.
+
+    The training data is split into one shard per worker. All workers share
+    one feature space, either the vocabulary of an already fitted TF-IDF
+    vectorizer or hashed features, so their parameters can be combined. After
+    every round the coordinator averages the workers' parameters, weighted by
+    shard size, and broadcasts the result for the next round.
+
+    Workers run as local processes talking to the coordinator over localhost
+    sockets, which stands in for workers on separate machines.
+    """
+    def __init__(self, config: DistributedTrainerConfig):
+        """
+        Initializes the DistributedTrainer component.
+
+        Args:
+            config (DistributedTrainerConfig): Configuration for distributed training.
+        """
+        self.config = config
+
+    def _build_vectorizer(self):
+        """
+        Builds the feature space shared by all workers.
+
+        Returns:
+            The vectorizer every worker uses to transform its shard.
+        """
+        if self.config.feature_space == 'vocabulary':
+            vectorizer = joblib.load(self.config.vocabulary_file_path)
+            logger.info(f"Using the fixed vocabulary of {len(vectorizer.vocabulary_)} terms from: {self.config.vocabulary_file_path}")
+        elif self.config.feature_space == 'hashing':
+            vectorizer = HashingVectorizer(stop_words='english', n_features=self.config.n_features, alternate_sign=False)
+            logger.info(f"Using {self.config.n_features} hashed features.")
+        else:
+            raise ValueError(f"Unknown feature space: {self.config.feature_space}")
+        return vectorizer
+
+    def _write_shards(self, train_df: pd.DataFrame, num_workers: int) -> list:
+        """
+        Splits the training data into one CSV shard per worker.
+
+        Args:
+            train_df (pd.DataFrame): The preprocessed training data.
+            num_workers (int): Number of shards to write.
+
+        Returns:
+            list: Paths of the written shards.
+        """
+        shard_paths = []
+        for i, shard_indices in enumerate(np.array_split(np.arange(len(train_df)), num_workers)):
+            shard_path = Path(self.config.shards_dir) / f"shard_{i + 1}_of_{num_workers}.csv"
+            train_df.iloc[shard_indices].to_csv(shard_path, index=False)
+            shard_paths.append(shard_path)
+        return shard_paths
+
+    def _assemble_model(self, classes, coef, intercept) -> SGDClassifier:
+        """
+        Builds a fitted classifier from the averaged parameters.
+        """
+        model = SGDClassifier(loss='log_loss', alpha=self.config.alpha, random_state=42)
+        model.classes_ = classes
+        model.coef_ = coef
+        model.intercept_ = intercept
+        model.n_features_in_ = coef.shape[1]
+        return model
+
+    def _accept_workers(self, listener: Listener, processes: list) -> list:
+        """
+        Waits until every worker process has connected.
+
+        Connections are accepted on a background thread, while this thread
+        checks that the workers are still running.
+
+        Args:
+            listener (Listener): The coordinator's listener.
+            processes (list): The started worker processes.
+
+        Raises:
+            RuntimeError: If a worker exits before connecting.
+            TimeoutError: If the workers do not all connect within `worker_timeout` seconds.
+
+        Returns:
+            list: One connection per worker.
+        """
+        accepted = queue.Queue()
+
+        def accept_all():
+            try:
+                for _ in processes:
+                    accepted.put(listener.accept())
+            except OSError:
+                # The listener was closed after a worker failed
+                pass
+
+        threading.Thread(target=accept_all, daemon=True).start()
+
+        connections = []
+        deadline = time.monotonic() + self.config.worker_timeout
+        while len(connections) < len(processes):
+            try:
+                connections.append(accepted.get(timeout=0.1))
+                continue
+            except queue.Empty:
+                pass
+            exit_codes = [process.exitcode for process in processes if process.exitcode is not None]
+            if exit_codes:
+                raise RuntimeError(f"A worker process exited with code {exit_codes[0]} before connecting.")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Only {len(connections)} of {len(processes)} workers connected "
+                                   f"within {self.config.worker_timeout} seconds.")
+        return connections
+
+    def _receive(self, conn):
+        """
+        Receives a message from a worker, waiting at most `worker_timeout` seconds.
+
+        A worker that exits closes its connection, which makes `recv` raise EOFError.
+        """
+        if not conn.poll(self.config.worker_timeout):
+            raise TimeoutError(f"A worker did not respond within {self.config.worker_timeout} seconds.")
+        return conn.recv()
+
+    def _train_with_workers(self, train_df: pd.DataFrame, vectorizer, classes, num_workers: int):
+        """
+        Runs one distributed training job.
+
+        Args:
+            train_df (pd.DataFrame): The preprocessed training data.
+            vectorizer: The shared vectorizer.
+            classes: All encoded labels of the training data.
+            num_workers (int): Number of worker processes.
+
+        Returns:
+            tuple: The trained model, the worker start-up time and the
+                   training time in seconds.
+        """
+        shard_paths = self._write_shards(train_df, num_workers)
+        authkey = os.urandom(16)
+        # Spawned workers start from a fresh interpreter, as they would on another node
+        context = multiprocessing.get_context('spawn')
+        # Workers send their log records here and only this process writes them
+        log_queue = context.Queue()
+        log_listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+
+        with Listener((self.config.host, self.config.port), authkey=authkey) as listener:
+            start = time.perf_counter()
+            processes = [
+                context.Process(target=run_worker, args=(listener.address, authkey, log_queue), daemon=True)
+                for _ in range(num_workers)
+            ]
+            log_listener.start()
+            try:
+                for process in processes:
+                    process.start()
+                connections = self._accept_workers(listener, processes)
+                startup_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for conn, shard_path in zip(connections, shard_paths):
+                    conn.send({
+                        'shard_path': str(shard_path),
+                        'vectorizer': vectorizer,
+                        'classes': classes,
+                        'alpha': self.config.alpha,
+                        'local_epochs': self.config.local_epochs
+                    })
+                shard_sizes = np.array([self._receive(conn) for conn in connections], dtype=float)
+                weights = shard_sizes / shard_sizes.sum()
+
+                params = None
+                for _ in range(self.config.rounds):
+                    for conn in connections:
+                        conn.send(('round', params))
+                    updates = [self._receive(conn) for conn in connections]
+                    # Allreduce through the coordinator: weighted average of all workers
+                    params = (
+                        sum(weight * coef for weight, (coef, _) in zip(weights, updates)),
+                        sum(weight * intercept for weight, (_, intercept) in zip(weights, updates))
+                    )
+
+                for conn in connections:
+                    conn.send(('stop', None))
+                    conn.close()
+                train_time = time.perf_counter() - start
+
+                for process in processes:
+                    process.join(self.config.worker_timeout)
+            finally:
+                for process in processes:
+                    if process.is_alive():
+                        process.terminate()
+                log_listener.stop()
+
+        return self._assemble_model(classes, *params), startup_time, train_time
+
+    def train(self, train_data_path: str, test_data_path: str):
+        """
+        Executes distributed training for every configured worker count.
+
+        The scaling report records the start-up time, training time, speedup
+        over the smallest worker count and test accuracy of each run. The model
+        trained with `num_workers` workers is saved with its vectorizer.
+
+        Args:
+            train_data_path (str): Path to the training data CSV.
+            test_data_path (str): Path to the testing data CSV.
+
+        Raises:
+            ValueError: If `rounds`, `local_epochs` or a worker count is below 1.
+        """
+        try:
+            logger.info("Starting distributed model training process.")
+
+            if self.config.rounds < 1 or self.config.local_epochs < 1:
+                raise ValueError(f"rounds and local_epochs must be at least 1, got "
+                                 f"{self.config.rounds} and {self.config.local_epochs}.")
+            worker_counts = sorted(set(self.config.worker_counts) | {self.config.num_workers})
+            if worker_counts[0] < 1:
+                raise ValueError(f"Worker counts must be at least 1, got num_workers={self.config.num_workers} "
+                                 f"and worker_counts={self.config.worker_counts}.")
+
+            train_df = pd.read_csv(train_data_path)
+            test_df = pd.read_csv(test_data_path)
+            train_df.dropna(subset=['text', 'label'], inplace=True)
+            test_df.dropna(subset=['text', 'label'], inplace=True)
+            logger.info("Loaded training and testing data.")
+
+            vectorizer = self._build_vectorizer()
+            classes = np.unique(train_df['label'])
+            tfidf_test = vectorizer.transform(test_df['text'])
+
+            results = []
+            base_train_time = None
+            for num_workers in worker_counts:
+                model, startup_time, train_time = self._train_with_workers(train_df, vectorizer, classes, num_workers)
+                accuracy = accuracy_score(test_df['label'], model.predict(tfidf_test))
+                base_train_time = base_train_time or train_time
+                results.append({
+                    'workers': num_workers,
+                    'startup_time_s': round(startup_time, 3),
+                    'train_time_s': round(train_time, 3),
+                    'speedup': round(base_train_time / train_time, 2),
+                    'accuracy': round(float(accuracy), 4)
+                })
+                logger.info(f"Distributed training with {num_workers} workers: {results[-1]}")
+                if num_workers == self.config.num_workers:
+                    final_model = model
+
+            save_json(path=Path(self.config.report_file_path), data={
+                'feature_space': self.config.feature_space,
+                'rounds': self.config.rounds,
+                'local_epochs': self.config.local_epochs,
+                'results': results
+            })
+
+            joblib.dump(final_model, self.config.trained_model_file_path)
+            joblib.dump(vectorizer, self.config.vectorizer_file_path)
+            logger.info(f"Saved distributed model to: {self.config.trained_model_file_path}")
+            logger.info(f"Saved shared vectorizer to: {self.config.vectorizer_file_path}")
+
+            logger.info("Distributed model training process finished successfully.")
+
+        except Exception as e:
+            logger.error(f"An error occurred during distributed model training: {e}")
+            raise e
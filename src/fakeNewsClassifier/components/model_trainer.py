@@ -1,19 +1,38 @@
+import os
+import time
+import tempfile
+import numpy as np
 import pandas as pd
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_selection import chi2
 from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import normalize
 import joblib
 from pathlib import Path
 from fakeNewsClassifier.logging import logger
 from fakeNewsClassifier.entity.config_entity import ModelTrainerConfig, DataTransformationConfig
+from fakeNewsClassifier.utils.common import save_json, cascade_predict, explain_predictions
 
 class ModelTrainer:
     """
     Trains the machine learning model for multi-class text classification.
-    
-    This component uses TF-IDF to vectorize the text data and trains a
-    Logistic Regression model. The trained model and the vectorizer are
-    then saved to disk.
+
+    This component uses TF-IDF to vectorize the text data, prunes the
+    vocabulary with a feature selection stage and trains a Logistic
+    Regression model. The pruned vectorizer and the model trained on it
+    are then saved to disk together, optionally alongside a much smaller
+    first-stage model for cascaded prediction.
     """
+    # Number of test documents scored one at a time when measuring latency
+    LATENCY_SAMPLE_SIZE = 200
+    # Number of classes and terms per explanation in the explanation benchmark
+    EXPLAIN_TOP_K = 3
+    # Timed repetitions in the explanation benchmark; the fastest one is kept
+    BENCHMARK_REPEATS = 5
+
     def __init__(self, config: ModelTrainerConfig):
         """
         Initializes the ModelTrainer component.
@@ -23,17 +42,376 @@ class ModelTrainer:
         """
         self.config = config
 
+    def _fit_model(self, features, labels) -> LogisticRegression:
+        """
+        Fits a Logistic Regression model on the given features.
+
+        Multi-class is handled automatically by LogisticRegression.
+        """
+        lr_model = LogisticRegression(random_state=42, solver='liblinear')
+        lr_model.fit(features, labels)
+        return lr_model
+
+    def _rank_features(self, tfidf_train, y_train, vectorizer: TfidfVectorizer, method: str = None):
+        """
+        Ranks the vocabulary terms by their usefulness for classification.
+
+        Args:
+            tfidf_train: TF-IDF matrix of the training data.
+            y_train: Encoded training labels.
+            vectorizer (TfidfVectorizer): The fitted full-vocabulary vectorizer.
+            method (str, optional): Scoring method. Defaults to the configured one.
+
+        Returns:
+            np.ndarray: Term indices ordered from most to least useful, or None
+                        when no top-k selection is configured.
+        """
+        method = method or self.config.selection_method
+        if method == 'none':
+            return None
+        if method == 'chi2':
+            scores, _ = chi2(tfidf_train, y_train)
+            scores = np.nan_to_num(scores)
+        elif method == 'coef':
+            # Largest absolute weight a term receives for any of the classes
+            scores = np.abs(self._fit_model(tfidf_train, y_train).coef_).max(axis=0)
+        else:
+            raise ValueError(f"Unknown feature selection method: {method}")
+        logger.info(f"Ranked {len(vectorizer.vocabulary_)} terms using '{method}' scores.")
+        return np.argsort(-scores, kind='stable')
+
+    def _prune_vectorizer(self, vectorizer: TfidfVectorizer, indices) -> TfidfVectorizer:
+        """
+        Builds a vectorizer restricted to a subset of the fitted vocabulary.
+
+        The pruned vectorizer reuses the IDF weights of the kept terms, so its
+        output equals the matching columns of the full TF-IDF matrix,
+        re-normalized. It does not carry the `stop_words_` attribute of the
+        fitted vectorizer, which lists every discarded term and otherwise
+        dominates the pickle size.
+
+        Args:
+            vectorizer (TfidfVectorizer): The fitted full-vocabulary vectorizer.
+            indices: Sorted column indices of the terms to keep.
+
+        Returns:
+            TfidfVectorizer: A ready-to-use vectorizer with the smaller vocabulary.
+        """
+        terms = vectorizer.get_feature_names_out()[indices]
+        pruned_vectorizer = clone(vectorizer)
+        pruned_vectorizer.set_params(vocabulary=list(terms))
+        pruned_vectorizer.idf_ = vectorizer.idf_[indices]
+        return pruned_vectorizer
+
+    def _fit_pruned(self, vectorizer: TfidfVectorizer, tfidf_train, y_train, indices):
+        """
+        Trains a model on a pruned vocabulary.
+
+        Args:
+            vectorizer (TfidfVectorizer): The fitted full-vocabulary vectorizer.
+            tfidf_train: TF-IDF matrix of the training data.
+            y_train: Encoded training labels.
+            indices: Column indices of the terms to keep.
+
+        Returns:
+            tuple: The pruned vectorizer and the model trained on it.
+        """
+        indices = np.sort(indices)
+        pruned_vectorizer = self._prune_vectorizer(vectorizer, indices)
+        # Same result as pruned_vectorizer.transform(X_train), without re-tokenizing
+        pruned_train = normalize(tfidf_train[:, indices])
+        return pruned_vectorizer, self._fit_model(pruned_train, y_train)
+
+    def _evaluate(self, vectorizer: TfidfVectorizer, model: LogisticRegression, X_test, y_test) -> dict:
+        """
+        Measures the accuracy and serving cost of a vectorizer/model pair.
+
+        Args:
+            vectorizer (TfidfVectorizer): The vectorizer to evaluate.
+            model (LogisticRegression): The model trained on its features.
+            X_test: Preprocessed test texts.
+            y_test: Encoded test labels.
+
+        Returns:
+            dict: Vocabulary size, accuracy, artifact size (KB), load time (ms)
+                  and mean single-document prediction latency (ms).
+        """
+        accuracy = accuracy_score(y_test, model.predict(vectorizer.transform(X_test)))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = os.path.join(tmp_dir, "model.pkl")
+            vectorizer_path = os.path.join(tmp_dir, "tfidf_vectorizer.pkl")
+            joblib.dump(model, model_path)
+            joblib.dump(vectorizer, vectorizer_path)
+            artifact_size = os.path.getsize(model_path) + os.path.getsize(vectorizer_path)
+
+            start = time.perf_counter()
+            loaded_model = joblib.load(model_path)
+            loaded_vectorizer = joblib.load(vectorizer_path)
+            load_time = time.perf_counter() - start
+
+        # Serving scores one headline at a time, so time single-document predictions
+        latency = self._time_per_document(
+            list(X_test), lambda text: loaded_model.predict(loaded_vectorizer.transform([text]))
+        )
+
+        return {
+            'vocabulary_size': len(vectorizer.vocabulary_),
+            'accuracy': round(float(accuracy), 4),
+            'artifact_size_kb': round(artifact_size / 1024, 1),
+            'load_time_ms': round(load_time * 1000, 2),
+            'latency_ms': round(latency, 3)
+        }
+
+    def _benchmark_explain(self, vectorizer: TfidfVectorizer, model: LogisticRegression, X_test) -> dict:
+        """
+        Compares the cost of explained predictions with plain predictions.
+
+        Both are timed on the whole test set in one batch, including the
+        TF-IDF transform, as `PredictionPipeline.predict_batch` and
+        `PredictionPipeline.predict_explain` run them.
+
+        Args:
+            vectorizer (TfidfVectorizer): The saved vectorizer.
+            model (LogisticRegression): The saved model.
+            X_test: Preprocessed test texts.
+
+        Returns:
+            dict: Batch size, best plain and explained batch times (ms) and their ratio.
+        """
+        texts = list(X_test)
+        feature_names = vectorizer.get_feature_names_out()
+
+        def best_time(func) -> float:
+            times = []
+            for _ in range(self.BENCHMARK_REPEATS):
+                start = time.perf_counter()
+                func()
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        predict_time = best_time(lambda: model.predict(vectorizer.transform(texts)))
+        explain_time = best_time(
+            lambda: explain_predictions(model, vectorizer.transform(texts), feature_names, self.EXPLAIN_TOP_K)
+        )
+        return {
+            'batch_size': len(texts),
+            'predict_ms': round(predict_time * 1000, 2),
+            'explain_ms': round(explain_time * 1000, 2),
+            'explain_to_predict_ratio': round(explain_time / predict_time, 2)
+        }
+
+    def _time_per_document(self, texts: list, predict_one) -> float:
+        """
+        Measures the mean latency of scoring single documents, as serving does.
+
+        The sample is timed `BENCHMARK_REPEATS` times and the fastest pass is
+        kept, which filters out most scheduling noise.
+
+        Args:
+            texts (list): Preprocessed texts; at most `LATENCY_SAMPLE_SIZE` are timed.
+            predict_one: Function that scores one text.
+
+        Returns:
+            float: Mean latency per document in milliseconds.
+        """
+        sample = texts[:self.LATENCY_SAMPLE_SIZE]
+        best = None
+        for _ in range(self.BENCHMARK_REPEATS):
+            start = time.perf_counter()
+            for text in sample:
+                predict_one(text)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best / max(len(sample), 1) * 1000
+
+    def _build_vectorizer(self) -> TfidfVectorizer:
+        """
+        Creates the unfitted TF-IDF vectorizer.
+
+        Using sublinear_tf=True can be effective for text data.
+        """
+        return TfidfVectorizer(
+            stop_words='english',
+            max_df=0.8,
+            min_df=self.config.min_df,
+            max_features=self.config.max_features,
+            sublinear_tf=True
+        )
+
+    def _cascade_indices(self, tfidf_train, y_train, vectorizer: TfidfVectorizer, ranking):
+        """
+        Selects the vocabularies of the full model and of the cascade's first stage.
+
+        Args:
+            tfidf_train: Full-vocabulary TF-IDF matrix of the training rows.
+            y_train: Encoded training labels.
+            vectorizer (TfidfVectorizer): The fitted full-vocabulary vectorizer.
+            ranking: Term ranking of the configured method, or None.
+
+        Returns:
+            tuple: Sorted full-vocabulary columns of the full model and of the
+                   first stage. The first stage keeps the highest-ranked terms,
+                   which are also part of the full model's vocabulary.
+        """
+        full_size = tfidf_train.shape[1]
+        if ranking is None or self.config.top_k is None:
+            final_indices = np.arange(full_size)
+        else:
+            final_indices = np.sort(ranking[:min(self.config.top_k, full_size)])
+        if ranking is None:
+            ranking = self._rank_features(tfidf_train, y_train, vectorizer, method='chi2')
+        first_stage_indices = np.sort(ranking[:min(self.config.first_stage_size, len(final_indices))])
+        return final_indices, first_stage_indices
+
+    def _fit_first_stage(self, tfidf_train, y_train, final_indices, first_stage_indices) -> dict:
+        """
+        Trains the first stage of the cascade.
+
+        The coefficients are scattered onto the columns of the saved vectorizer,
+        so `cascade_predict` can score the first stage directly on the full
+        TF-IDF matrix.
+
+        Args:
+            tfidf_train: Full-vocabulary TF-IDF matrix of the training rows.
+            y_train: Encoded training labels.
+            final_indices: Sorted full-vocabulary columns of the saved vectorizer.
+            first_stage_indices: Sorted full-vocabulary columns of the first stage,
+                                 a subset of `final_indices`.
+
+        Returns:
+            dict: The first-stage 'model', its 'weights', 'intercept', 'classes',
+                  the 'in_vocabulary' mask over the saved vectorizer's columns and
+                  the 'vocabulary_size' of the saved vectorizer.
+        """
+        first_model = self._fit_model(normalize(tfidf_train[:, first_stage_indices]), y_train)
+        columns = np.searchsorted(final_indices, first_stage_indices)
+
+        weights = np.zeros((len(final_indices), first_model.coef_.shape[0]))
+        weights[columns] = first_model.coef_.T
+        in_vocabulary = np.zeros(len(final_indices))
+        in_vocabulary[columns] = 1.0
+        return {
+            'model': first_model,
+            'weights': weights,
+            'intercept': first_model.intercept_,
+            'classes': first_model.classes_,
+            'in_vocabulary': in_vocabulary,
+            'vocabulary_size': len(final_indices)
+        }
+
+    def _evaluate_cascade(self, first_stage: dict, vectorizer: TfidfVectorizer, model: LogisticRegression,
+                          texts: list, labels, thresholds: list):
+        """
+        Measures the full model alone and the cascade at each threshold.
+
+        Args:
+            first_stage (dict): The first stage, as built by `_fit_first_stage`.
+            vectorizer (TfidfVectorizer): The full vectorizer.
+            model (LogisticRegression): The full model.
+            texts (list): Preprocessed texts.
+            labels: Encoded labels of the texts.
+            thresholds (list): Confidence thresholds to evaluate.
+
+        Returns:
+            tuple: Accuracy and latency of the full model, and the fraction
+                   answered early, accuracy and latency for every threshold.
+        """
+        features = vectorizer.transform(texts)
+        full_model = {
+            'accuracy': round(float(accuracy_score(labels, model.predict(features))), 4),
+            'latency_ms': round(self._time_per_document(texts, lambda text: model.predict(vectorizer.transform([text]))), 3)
+        }
+
+        results = []
+        for threshold in thresholds:
+            predictions, answered_early = cascade_predict(first_stage, model, features, threshold)
+            latency = self._time_per_document(
+                texts, lambda text: cascade_predict(first_stage, model, vectorizer.transform([text]), threshold)
+            )
+            results.append({
+                'threshold': threshold,
+                'answered_early': round(float(answered_early.mean()), 4),
+                'accuracy': round(float(accuracy_score(labels, predictions)), 4),
+                'latency_ms': round(latency, 3)
+            })
+        return full_model, results
+
+    def _calibrate_cascade(self, X_train, y_train):
+        """
+        Chooses the first-stage confidence threshold of the cascade.
+
+        Part of the training data is held out for calibration before anything
+        is fitted: the vectorizer, the feature ranking and both stages only see
+        the remaining rows. Every candidate threshold is then evaluated on the
+        calibration rows, and the lowest one whose cascade accuracy stays
+        within `max_accuracy_drop` of the full model is selected, as it answers
+        the most items early. Latency is reported but does not decide the
+        threshold.
+
+        Args:
+            X_train: Preprocessed training texts.
+            y_train: Encoded training labels.
+
+        Returns:
+            tuple: The selected threshold (None when no threshold qualifies)
+                   and the calibration report.
+        """
+        texts = np.asarray(X_train, dtype=object)
+        labels = np.asarray(y_train)
+        fit_rows, calibration_rows = train_test_split(
+            np.arange(len(labels)), test_size=self.config.calibration_size, random_state=42, stratify=labels
+        )
+
+        vectorizer = self._build_vectorizer()
+        tfidf_fit = vectorizer.fit_transform(texts[fit_rows])
+        ranking = self._rank_features(tfidf_fit, labels[fit_rows], vectorizer)
+        final_indices, first_stage_indices = self._cascade_indices(tfidf_fit, labels[fit_rows], vectorizer, ranking)
+
+        model = self._fit_model(normalize(tfidf_fit[:, final_indices]), labels[fit_rows])
+        first_stage = self._fit_first_stage(tfidf_fit, labels[fit_rows], final_indices, first_stage_indices)
+
+        full_model, results = self._evaluate_cascade(
+            first_stage, self._prune_vectorizer(vectorizer, final_indices), model,
+            list(texts[calibration_rows]), labels[calibration_rows], sorted(self.config.cascade_thresholds)
+        )
+        for result in results:
+            logger.info(f"Cascade threshold {result['threshold']} on calibration data: {result}")
+        logger.info(f"Full model on calibration data: {full_model}")
+
+        selected_threshold = None
+        for result in results:
+            if result['accuracy'] >= full_model['accuracy'] - self.config.max_accuracy_drop:
+                selected_threshold = result['threshold']
+                break
+
+        report = {
+            'calibration_size': len(calibration_rows),
+            'full_model': full_model,
+            'results': results
+        }
+        return selected_threshold, report
+
     def train(self, train_data_path: str, test_data_path: str, data_transformation_config: DataTransformationConfig):
         """
         Executes the model training process.
 
+        A model is trained for every vocabulary size listed in the configuration
+        and compared in the feature selection report. The pair trained on the
+        configured `top_k` vocabulary is the one saved for serving. When a
+        cascade is configured, a first-stage model is trained on the
+        `first_stage_size` highest-ranked terms. Its confidence threshold is
+        calibrated on training rows held out from vectorization, feature
+        ranking and fitting. The first stage is only saved when a threshold
+        keeps the accuracy of the full model.
+
         Args:
             train_data_path (str): Path to the training data CSV.
             test_data_path (str): Path to the testing data CSV.
         """
         try:
             logger.info("Starting model training process for BBC data.")
-            
+
             # Load the datasets
             train_df = pd.read_csv(train_data_path)
             test_df = pd.read_csv(test_data_path)
@@ -48,28 +426,88 @@ class ModelTrainer:
             y_train = train_df['label']
             X_test = test_df['text']
             y_test = test_df['label']
-            
+
             # Initialize TF-IDF Vectorizer
-            # Using sublinear_tf=True can be effective for text data
-            tfidf_vectorizer = TfidfVectorizer(stop_words='english', max_df=0.8, sublinear_tf=True)
-            
-            # Fit and transform the training data, transform the test data
+            tfidf_vectorizer = self._build_vectorizer()
+
+            # Fit and transform the training data
             tfidf_train = tfidf_vectorizer.fit_transform(X_train)
-            tfidf_test = tfidf_vectorizer.transform(X_test)
-            logger.info("Applied TF-IDF vectorization to the data.")
-            
-            # Initialize and train the Logistic Regression model
-            # Multi-class is handled automatically by LogisticRegression
-            lr_model = LogisticRegression(random_state=42, solver='liblinear')
-            lr_model.fit(tfidf_train, y_train)
+            full_size = len(tfidf_vectorizer.vocabulary_)
+            logger.info(f"Applied TF-IDF vectorization to the data. Vocabulary size: {full_size}")
+
+            # --- Feature Selection ---
+            ranking = self._rank_features(tfidf_train, y_train, tfidf_vectorizer)
+            if ranking is None or self.config.top_k is None:
+                selected_size = full_size
+            else:
+                selected_size = min(self.config.top_k, full_size)
+            sizes = {full_size, selected_size}
+            if ranking is not None:
+                sizes.update(size for size in self.config.report_sizes if size < full_size)
+
+            results = []
+            for size in sorted(sizes):
+                indices = np.arange(full_size) if size == full_size else ranking[:size]
+                vectorizer, model = self._fit_pruned(tfidf_vectorizer, tfidf_train, y_train, indices)
+                result = self._evaluate(vectorizer, model, X_test, y_test)
+                results.append(result)
+                logger.info(f"Vocabulary size {size}: {result}")
+                if size == selected_size:
+                    final_vectorizer, lr_model, final_indices = vectorizer, model, np.sort(indices)
             logger.info("Model training complete.")
-            
+
+            explain_benchmark = self._benchmark_explain(final_vectorizer, lr_model, X_test)
+            logger.info(f"Explained vs. plain prediction cost: {explain_benchmark}")
+
+            save_json(path=Path(self.config.report_file_path), data={
+                'selection_method': self.config.selection_method,
+                'full_vocabulary_size': full_size,
+                'saved_vocabulary_size': selected_size,
+                'results': results,
+                'explain_benchmark': explain_benchmark
+            })
+
             # Save the trained model and the vectorizer
             joblib.dump(lr_model, self.config.trained_model_file_path)
-            joblib.dump(tfidf_vectorizer, self.config.vectorizer_file_path)
+            joblib.dump(final_vectorizer, self.config.vectorizer_file_path)
             logger.info(f"Saved trained model to: {self.config.trained_model_file_path}")
             logger.info(f"Saved TF-IDF vectorizer to: {self.config.vectorizer_file_path}")
-            
+
+            # --- Cascade First Stage ---
+            first_stage = None
+            if self.config.first_stage_size:
+                _, first_stage_indices = self._cascade_indices(tfidf_train, y_train, tfidf_vectorizer, ranking)
+                threshold, calibration = self._calibrate_cascade(X_train, y_train)
+                cascade_report = {
+                    'first_stage_vocabulary_size': len(first_stage_indices),
+                    'full_vocabulary_size': selected_size,
+                    'selected_threshold': threshold,
+                    'calibration': calibration
+                }
+
+                if threshold is None:
+                    logger.info("No cascade threshold keeps the accuracy of the full model. "
+                                "The cascade first stage is not saved.")
+                else:
+                    first_stage = self._fit_first_stage(tfidf_train, y_train, final_indices, first_stage_indices)
+                    first_stage['threshold'] = threshold
+                    full_model, test_results = self._evaluate_cascade(
+                        first_stage, final_vectorizer, lr_model, list(X_test), y_test, [threshold]
+                    )
+                    cascade_report['test'] = {'full_model': full_model, 'cascade': test_results[0]}
+                    logger.info(f"Cascade on test data: {cascade_report['test']}")
+
+                save_json(path=Path(self.config.cascade_report_file_path), data=cascade_report)
+
+            first_stage_path = Path(self.config.first_stage_file_path)
+            if first_stage is not None:
+                joblib.dump(first_stage, first_stage_path)
+                logger.info(f"Saved cascade first stage (threshold {first_stage['threshold']}) to: {first_stage_path}")
+            elif first_stage_path.exists():
+                # A first stage from an earlier run does not match the new vectorizer
+                first_stage_path.unlink()
+                logger.info(f"Removed outdated cascade first stage: {first_stage_path}")
+
             logger.info("Model training process finished successfully.")
 
 
@@ -84,4 +522,4 @@ class ModelTrainer:
 
         except Exception as e:
             logger.error(f"An error occurred during model training: {e}")
-            raise e
\ No newline at end of file
+            raise e
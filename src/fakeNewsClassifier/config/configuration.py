@@ -3,7 +3,8 @@ from pathlib import Path
 from fakeNewsClassifier.utils.common import read_yaml, create_directories
 from fakeNewsClassifier.entity.config_entity import (DataIngestionConfig,
                                                       DataTransformationConfig,
-                                                      ModelTrainerConfig)
+                                                      ModelTrainerConfig,
+                                                      DistributedTrainerConfig)
 
 class ConfigurationManager:
     """
@@ -70,13 +71,59 @@ class ConfigurationManager:
             ModelTrainerConfig: A dataclass object with model training settings.
         """
         config = self.config.model_trainer
+        feature_selection = config.feature_selection
+        cascade = config.cascade
         
         create_directories([config.root_dir])
 
         model_trainer_config = ModelTrainerConfig(
             root_dir=Path(config.root_dir),
             trained_model_file_path=Path(config.trained_model_file_path),
-            vectorizer_file_path=Path(config.vectorizer_file_path)
+            vectorizer_file_path=Path(config.vectorizer_file_path),
+            report_file_path=Path(config.report_file_path),
+            min_df=feature_selection.min_df,
+            max_features=feature_selection.max_features,
+            selection_method=feature_selection.method,
+            top_k=feature_selection.top_k,
+            report_sizes=list(feature_selection.report_sizes),
+            first_stage_size=cascade.first_stage_size,
+            first_stage_file_path=Path(cascade.first_stage_file_path),
+            cascade_report_file_path=Path(cascade.report_file_path),
+            cascade_thresholds=list(cascade.thresholds),
+            max_accuracy_drop=cascade.max_accuracy_drop,
+            calibration_size=cascade.calibration_size
         )
 
-        return model_trainer_config
\ No newline at end of file
+        return model_trainer_config
+
+    def get_distributed_trainer_config(self) -> DistributedTrainerConfig:
+        """
+        Retrieves the distributed trainer configuration.
+
+        Returns:
+            DistributedTrainerConfig: A dataclass object with distributed training settings.
+        """
+        config = self.config.distributed_trainer
+
+        create_directories([config.root_dir, config.shards_dir])
+
+        distributed_trainer_config = DistributedTrainerConfig(
+            root_dir=Path(config.root_dir),
+            shards_dir=Path(config.shards_dir),
+            trained_model_file_path=Path(config.trained_model_file_path),
+            vectorizer_file_path=Path(config.vectorizer_file_path),
+            report_file_path=Path(config.report_file_path),
+            host=config.host,
+            port=config.port,
+            feature_space=config.feature_space,
+            vocabulary_file_path=Path(config.vocabulary_file_path),
+            n_features=config.n_features,
+            num_workers=config.num_workers,
+            worker_counts=list(config.worker_counts),
+            rounds=config.rounds,
+            local_epochs=config.local_epochs,
+            alpha=config.alpha,
+            worker_timeout=config.worker_timeout
+        )
+
+        return distributed_trainer_config
\ No newline at end of file
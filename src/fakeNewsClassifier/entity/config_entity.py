@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import List, Optional
 
 # Using dataclasses to define the structure for data ingestion configuration.
 # This ensures type safety and makes the configuration object-oriented.
@@ -45,7 +46,72 @@ class ModelTrainerConfig:
         root_dir (Path): Root directory for model training artifacts.
         trained_model_file_path (Path): Path to save the trained model (.pkl).
         vectorizer_file_path (Path): Path to save the TF-IDF vectorizer (.pkl).
+        report_file_path (Path): Path to save the feature selection report (.json).
+        min_df (int): Minimum document frequency for a term to enter the vocabulary.
+        max_features (Optional[int]): Maximum vocabulary size kept by the vectorizer.
+        selection_method (str): Top-k scoring method: "none", "chi2" or "coef".
+        top_k (Optional[int]): Vocabulary size of the saved model.
+        report_sizes (List[int]): Vocabulary sizes compared in the report.
+        first_stage_size (Optional[int]): Vocabulary size of the cascade's first stage.
+        first_stage_file_path (Path): Path to save the first-stage model, vocabulary columns and threshold (.pkl).
+        cascade_report_file_path (Path): Path to save the cascade threshold report (.json).
+        cascade_thresholds (List[float]): Candidate first-stage confidence thresholds.
+        max_accuracy_drop (float): Largest accepted cascade accuracy loss versus the full model.
+        calibration_size (float): Fraction of the training data held out to choose the threshold.
     """
     root_dir: Path
     trained_model_file_path: Path
-    vectorizer_file_path: Path
\ No newline at end of file
+    vectorizer_file_path: Path
+    report_file_path: Path
+    min_df: int
+    max_features: Optional[int]
+    selection_method: str
+    top_k: Optional[int]
+    report_sizes: List[int]
+    first_stage_size: Optional[int]
+    first_stage_file_path: Path
+    cascade_report_file_path: Path
+    cascade_thresholds: List[float]
+    max_accuracy_drop: float
+    calibration_size: float
+
+
+@dataclass(frozen=True)
+class DistributedTrainerConfig:
+    """
+    Configuration for the Distributed Trainer component.
+
+    Attributes:
+        root_dir (Path): Root directory for distributed training artifacts.
+        shards_dir (Path): Directory where the training data shards are written.
+        trained_model_file_path (Path): Path to save the trained model (.pkl).
+        vectorizer_file_path (Path): Path to save the shared vectorizer (.pkl).
+        report_file_path (Path): Path to save the scaling report (.json).
+        host (str): Address the coordinator listens on.
+        port (int): Port the coordinator listens on (0 picks a free port).
+        feature_space (str): Shared feature space: "vocabulary" or "hashing".
+        vocabulary_file_path (Path): Fitted TF-IDF vectorizer whose vocabulary is reused.
+        n_features (int): Number of hashed features.
+        num_workers (int): Number of workers used for the saved model.
+        worker_counts (List[int]): Worker counts compared in the scaling report.
+        rounds (int): Number of parameter averaging rounds.
+        local_epochs (int): Passes over its shard each worker makes per round.
+        alpha (float): L2 regularization strength.
+        worker_timeout (int): Seconds to wait for a worker to connect or reply.
+    """
+    root_dir: Path
+    shards_dir: Path
+    trained_model_file_path: Path
+    vectorizer_file_path: Path
+    report_file_path: Path
+    host: str
+    port: int
+    feature_space: str
+    vocabulary_file_path: Path
+    n_features: int
+    num_workers: int
+    worker_counts: List[int]
+    rounds: int
+    local_epochs: int
+    alpha: float
+    worker_timeout: int
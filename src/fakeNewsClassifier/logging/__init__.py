@@ -1,6 +1,12 @@
 import os
 import sys
+import queue
+import atexit
 import logging
+import itertools
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import yaml
+from fakeNewsClassifier.constants import CONFIG_FILE_PATH
 
 # Define the logging format string
 # Example: [ 2023-07-26 10:30:00,123 ] INFO - module_name: log message
@@ -11,15 +17,138 @@ log_dir = "logs"
 log_filepath = os.path.join(log_dir, "running_logs.log")
 os.makedirs(log_dir, exist_ok=True)
 
+# Settings used when config.yaml has no 'logging' section (or cannot be found).
+# They reproduce the original synchronous, non-rotating behaviour.
+DEFAULT_LOGGING_CONFIG = {
+    'mode': 'sync',
+    'level': 'INFO',
+    'max_bytes': 0,
+    'backup_count': 0,
+    'levels': {},
+    'sampling': {'every_n': 1, 'max_level': 'INFO'}
+}
+
+
+def _read_logging_config() -> dict:
+    """
+    Reads the 'logging' section of the main config file.
+
+    The YAML is loaded directly rather than through `utils.common.read_yaml`,
+    because that helper logs through the logger configured here.
+    """
+    logging_config = dict(DEFAULT_LOGGING_CONFIG)
+    try:
+        with open(CONFIG_FILE_PATH) as yaml_file:
+            content = yaml.safe_load(yaml_file) or {}
+        logging_config.update(content.get('logging') or {})
+    except OSError:
+        pass
+    return logging_config
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only every n-th record emitted from each logging call site.
+
+    Records above `max_level` (warnings and errors by default) always pass,
+    so sampling only thins out high-frequency informational messages.
+    """
+    def __init__(self, every_n: int, max_level: int):
+        super().__init__()
+        self.every_n = every_n
+        self.max_level = max_level
+        self._counters = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        key = (record.pathname, record.lineno)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        return next(counter) % self.every_n == 0
+
+
+logging_config = _read_logging_config()
+
+# Size-based rotation is disabled when max_bytes is 0
+file_handler = RotatingFileHandler(
+    log_filepath,
+    maxBytes=logging_config['max_bytes'],
+    backupCount=logging_config['backup_count']
+)
+output_handlers = [
+    file_handler,                     # Log to a file
+    logging.StreamHandler(sys.stdout) # Log to the console
+]
+
+if logging_config['mode'] == 'async':
+    # Callers only put records on an in-memory queue; a background listener
+    # thread performs the file and console writes.
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter(logging_str)
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+    queue_handler = QueueHandler(log_queue)
+    # Only the message is rendered on the calling thread; the listener's
+    # handlers apply the full format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    handlers = [queue_handler]
+    listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+elif logging_config['mode'] == 'sync':
+    listener = None
+    handlers = output_handlers
+else:
+    raise ValueError(f"Unknown logging mode: {logging_config['mode']}")
+
+sampling = logging_config['sampling'] or {}
+# The level may be given as a name ('INFO') or a number (20)
+max_level = sampling.get('max_level', 'INFO')
+if isinstance(max_level, str):
+    max_level = logging.getLevelName(max_level.upper())
+if not isinstance(max_level, int) or isinstance(max_level, bool):
+    raise ValueError(f"Unknown sampling max_level: {sampling.get('max_level')}")
+if sampling.get('every_n', 1) > 1:
+    # Each handler gets its own counters: a shared filter would advance them
+    # once per handler and split the records between the handlers
+    for handler in handlers:
+        handler.addFilter(SamplingFilter(sampling['every_n'], max_level))
+
 # Basic configuration for the logging system
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging_config['level'],
     format=logging_str,
-    handlers=[
-        logging.FileHandler(log_filepath), # Log to a file
-        logging.StreamHandler(sys.stdout)  # Log to the console
-    ]
+    handlers=handlers
 )
 
+# Per-logger level overrides, e.g. to quieten third-party loggers
+for logger_name, level in (logging_config['levels'] or {}).items():
+    logging.getLogger(logger_name).setLevel(level)
+
 # Create a logger instance that can be imported and used across the project
 logger = logging.getLogger("fakeNewsClassifierLogger")
+
+
+def forward_to_queue(log_queue):
+    """
+    Sends every record of the current process to a queue instead of writing it.
+
+    Used by worker processes, so that only the parent process writes and
+    rotates the log file. The parent drains the queue into its own handlers.
+
+    Args:
+        log_queue: A multiprocessing queue shared with the parent process.
+    """
+    global listener
+    if listener is not None:
+        listener.stop()
+        atexit.unregister(listener.stop)
+        listener = None
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    for handler in output_handlers:
+        handler.close()
+    root_logger.addHandler(QueueHandler(log_queue))
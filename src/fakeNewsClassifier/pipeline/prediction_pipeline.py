@@ -4,6 +4,8 @@ import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from pathlib import Path
+from fakeNewsClassifier.logging import logger
+from fakeNewsClassifier.utils.common import cascade_predict, explain_predictions
 
 class PredictionPipeline:
     """
@@ -11,15 +13,42 @@ class PredictionPipeline:
     
     This class loads the trained model, vectorizer, and label encoder,
     preprocesses input text, and returns a predicted category name.
+
+    In cascade mode a small first-stage model answers the texts it is
+    confident about, and only the remaining ones are scored by the full model.
     """
-    def __init__(self):
+    def __init__(self, cascade: bool = False, threshold: float = None):
         """
         Initializes the PredictionPipeline by loading the trained model,
         TF-IDF vectorizer, and LabelEncoder from their saved paths.
+
+        Args:
+            cascade (bool, optional): If True, also loads the first-stage model
+                                      and predicts through the cascade. Without a saved
+                                      first stage the full model is used. Defaults to False.
+            threshold (float, optional): First-stage confidence threshold. Defaults to
+                                         the threshold calibrated during training.
+
+        Raises:
+            ValueError: If the saved first stage does not match the saved vectorizer.
         """
         self.model = joblib.load(Path('artifacts/model_trainer/model.pkl'))
         self.vectorizer = joblib.load(Path('artifacts/model_trainer/tfidf_vectorizer.pkl'))
         self.label_encoder = joblib.load(Path('artifacts/model_trainer/label_encoder.pkl'))
+        # Term of each TF-IDF column, used to name the terms in explanations
+        self.feature_names = self.vectorizer.get_feature_names_out()
+
+        self.first_stage = None
+        first_stage_path = Path('artifacts/model_trainer/first_stage.pkl')
+        if cascade and first_stage_path.exists():
+            self.first_stage = joblib.load(first_stage_path)
+            if self.first_stage.get('vocabulary_size') != len(self.feature_names):
+                raise ValueError(f"The cascade first stage at {first_stage_path} was trained for a different "
+                                 f"vectorizer. Retrain the model to rebuild it.")
+            self.threshold = self.first_stage['threshold'] if threshold is None else threshold
+        elif cascade:
+            # Training only saves a first stage when a threshold keeps the full model's accuracy
+            logger.warning(f"No cascade first stage found at {first_stage_path}, using the full model only.")
         
         self._download_nltk_resources()
 
@@ -58,11 +87,67 @@ class PredictionPipeline:
         Returns:
             str: The predicted category name (e.g., "tech", "sport").
         """
-        processed_text = self._preprocess_text(text)
-        vectorized_text = self.vectorizer.transform([processed_text])
-        prediction_numeric = self.model.predict(vectorized_text)
-        
-        # Decode the numeric prediction back to its string label
-        prediction_label = self.label_encoder.inverse_transform(prediction_numeric)[0]
-        
-        return prediction_label.capitalize()
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: list) -> list:
+        """
+        Makes predictions on several pieces of input text at once.
+
+        Args:
+            texts (list): The raw news article texts.
+
+        Returns:
+            list: The predicted category names, in the order of the input texts.
+        """
+        processed_texts = [self._preprocess_text(text) for text in texts]
+        features = self.vectorizer.transform(processed_texts)
+        if self.first_stage is None:
+            predictions_numeric = self.model.predict(features)
+        else:
+            predictions_numeric, _ = cascade_predict(self.first_stage, self.model, features, self.threshold)
+
+        # Decode the numeric predictions back to their string labels
+        prediction_labels = self.label_encoder.inverse_transform(predictions_numeric)
+
+        return [label.capitalize() for label in prediction_labels]
+
+    def predict_explain(self, texts: list, k: int = 3) -> list:
+        """
+        Makes predictions with their confidence and the terms behind them.
+
+        Explanations always come from the full model, also in cascade mode.
+
+        Args:
+            texts (list): The raw news article texts.
+            k (int, optional): Number of categories and terms to return per text.
+                               Defaults to 3.
+
+        Returns:
+            list: One dictionary per input text, for example:
+                  {'category': 'Tech',
+                   'probabilities': [{'category': 'Tech', 'probability': 0.91}, ...],
+                   'terms': [{'term': 'software', 'weight': 0.42}, ...]}
+        """
+        if not texts:
+            return []
+
+        processed_texts = [self._preprocess_text(text) for text in texts]
+        features = self.vectorizer.transform(processed_texts)
+        explanations = explain_predictions(self.model, features, self.feature_names, k)
+
+        results = []
+        for explanation in explanations:
+            # Decode the numeric classes back to their string labels
+            labels = [label.capitalize() for label in self.label_encoder.inverse_transform(explanation['classes'])]
+            results.append({
+                'category': labels[0],
+                'probabilities': [
+                    {'category': label, 'probability': round(float(probability), 4)}
+                    for label, probability in zip(labels, explanation['probabilities'])
+                ],
+                'terms': [
+                    {'term': term, 'weight': round(weight, 4)}
+                    for term, weight in explanation['terms']
+                ]
+            })
+        return results
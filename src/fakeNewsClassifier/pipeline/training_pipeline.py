@@ -1,7 +1,9 @@
+import argparse
 from fakeNewsClassifier.config.configuration import ConfigurationManager
 from fakeNewsClassifier.components.data_ingestion import DataIngestion
 from fakeNewsClassifier.components.data_transformation import DataTransformation
 from fakeNewsClassifier.components.model_trainer import ModelTrainer
+from fakeNewsClassifier.components.distributed_trainer import DistributedTrainer
 from fakeNewsClassifier.logging import logger
 
 class TrainPipeline:
@@ -12,6 +14,7 @@ class TrainPipeline:
     1. Data Ingestion
     2. Data Transformation
     3. Model Training
+    4. Distributed Model Training (optional)
     """
     def __init__(self):
         """
@@ -20,9 +23,13 @@ class TrainPipeline:
         self.config_manager = ConfigurationManager()
         
 
-    def main(self):
+    def main(self, distributed: bool = False):
         """
         The main entry point to run the training pipeline.
+
+        Args:
+            distributed (bool, optional): If True, also trains a model with
+                                          data-parallel workers. Defaults to False.
         """
         try:
             logger.info("Starting the full training pipeline for BBC News dataset.")
@@ -52,6 +59,17 @@ class TrainPipeline:
             )
             logger.info("Model Trainer component finished successfully.")
 
+            # --- Distributed Model Training Step ---
+            if distributed:
+                logger.info("Executing Distributed Trainer component.")
+                distributed_trainer_config = self.config_manager.get_distributed_trainer_config()
+                distributed_trainer = DistributedTrainer(config=distributed_trainer_config)
+                distributed_trainer.train(
+                    train_data_path=data_transformation_config.transformed_data_path,
+                    test_data_path=data_transformation_config.test_data_path
+                )
+                logger.info("Distributed Trainer component finished successfully.")
+
             logger.info(">>> Full training pipeline finished successfully. <<<")
 
         except Exception as e:
@@ -60,5 +78,10 @@ class TrainPipeline:
 
 # This block allows the script to be run directly
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the BBC News training pipeline.")
+    parser.add_argument('--distributed', action='store_true',
+                        help="Also train a model with data-parallel worker processes.")
+    args = parser.parse_args()
+
     pipeline = TrainPipeline()
-    pipeline.main()
\ No newline at end of file
+    pipeline.main(distributed=args.distributed)
\ No newline at end of file
@@ -1,4 +1,7 @@
 import os
+import json
+import numpy as np
+from scipy.special import expit
 from box.exceptions import BoxValueError
 import yaml
 from fakeNewsClassifier.logging import logger
@@ -62,4 +65,112 @@ def get_size(path: Path) -> str:
         str: The size of the file in KB as a formatted string.
     """
     size_in_kb = round(os.path.getsize(path) / 1024)
-    return f"~ {size_in_kb} KB"
\ No newline at end of file
+    return f"~ {size_in_kb} KB"
+
+@ensure_annotations
+def save_json(path: Path, data: dict):
+    """
+    Saves a dictionary as a JSON file.
+
+    Args:
+        path (Path): Path of the JSON file.
+        data (dict): Data to be saved.
+    """
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+    logger.info(f"JSON file saved at: {path}")
+
+
+def cascade_predict(first_stage: dict, model, features, threshold: float):
+    """
+    Predicts labels with a two-stage confidence cascade.
+
+    Both stages score rows of the same TF-IDF matrix, so every text is only
+    tokenized once. The first stage is scored with plain array operations: its
+    coefficients are stored against the columns of the full matrix, and each
+    row is re-normalized over the first-stage vocabulary only, which matches
+    scoring `normalize(features[:, indices])` without slicing the matrix.
+    Rows whose top-class probability is below the threshold are scored again
+    by the full model; the others keep the first-stage prediction.
+
+    Args:
+        first_stage (dict): The first-stage 'weights' (full-matrix columns x classes),
+                            'intercept', 'classes' and 'in_vocabulary' column mask.
+        model: The full model.
+        features: Sparse TF-IDF matrix of the full vectorizer, one row per text.
+        threshold (float): Minimum first-stage probability to answer early.
+
+    Returns:
+        tuple: The numeric predictions and a boolean mask of the rows answered
+               by the first stage.
+    """
+    features = features.tocsr()
+    row_ids = np.repeat(np.arange(features.shape[0]), np.diff(features.indptr))
+    squared = features.data ** 2 * first_stage['in_vocabulary'][features.indices]
+    norms = np.sqrt(np.bincount(row_ids, weights=squared, minlength=features.shape[0]))
+    norms[norms == 0] = 1.0
+    decision = np.asarray(features @ first_stage['weights']) / norms[:, np.newaxis] + first_stage['intercept']
+
+    # One-vs-rest probabilities of a liblinear LogisticRegression, as predict_proba computes them
+    probabilities = expit(decision)
+    if probabilities.shape[1] == 1:
+        probabilities = np.hstack([1 - probabilities, probabilities])
+    else:
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+
+    predictions = first_stage['classes'][probabilities.argmax(axis=1)]
+    answered_early = probabilities.max(axis=1) >= threshold
+
+    escalated = np.flatnonzero(~answered_early)
+    if len(escalated) == len(predictions):
+        predictions = model.predict(features)
+    elif len(escalated):
+        predictions[escalated] = model.predict(features[escalated])
+    return predictions, answered_early
+
+
+def explain_predictions(model, features, feature_names, k: int) -> list:
+    """
+    Computes top-k class probabilities and term attributions for a batch.
+
+    The contribution of a term to a prediction is its TF-IDF value times the
+    coefficient of the predicted class. Only the non-zero entries of the sparse
+    TF-IDF rows are multiplied with the matching coefficients, all rows at once.
+
+    Args:
+        model: A fitted linear model with `coef_` and `predict_proba`.
+        features: Sparse TF-IDF matrix, one row per document.
+        feature_names: Term of each feature column.
+        k (int): Number of classes and terms to return per document.
+
+    Returns:
+        list: One dict per document with the numeric 'classes' and their
+              'probabilities' (most likely first) and the 'terms' that contributed
+              most to the predicted class as (term, contribution) pairs.
+    """
+    features = features.tocsr()
+    probabilities = model.predict_proba(features)
+    top_classes = np.argsort(-probabilities, axis=1)[:, :k]
+    predicted = top_classes[:, 0]
+
+    # Row of every stored entry, to look up the coefficient of its predicted class
+    row_ids = np.repeat(np.arange(features.shape[0]), np.diff(features.indptr))
+    if model.coef_.shape[0] == 1:
+        # Binary models only store the coefficients of the positive class
+        weights = model.coef_[0, features.indices] * np.where(predicted[row_ids] == 1, 1.0, -1.0)
+    else:
+        weights = model.coef_[predicted[row_ids], features.indices]
+    contributions = features.data * weights
+
+    explanations = []
+    for i, row_classes in enumerate(top_classes):
+        start, end = features.indptr[i], features.indptr[i + 1]
+        row_contributions = contributions[start:end]
+        top_terms = np.argsort(-row_contributions)[:k]
+        explanations.append({
+            'classes': model.classes_[row_classes],
+            'probabilities': probabilities[i, row_classes],
+            'terms': [(feature_names[features.indices[start + j]], float(row_contributions[j]))
+                      for j in top_terms if row_contributions[j] > 0]
+        })
+    return explanations